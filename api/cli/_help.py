@@ -83,36 +83,3 @@ def _get_command_params_info(cmd):
 
     return " ".join(parts)
 
-
-def _generate_command_example(group_name, cmd_name, cmd):
-    """Auto-generate realistic examples for commands"""
-    examples = {
-        # Project examples
-        ('project', 'create'): 'project create my-app --emoji 🚀',
-        ('project', 'list'): 'project list --sort name',
-        ('project', 'delete'): 'project delete my-app --yes',
-        ('project', 'show'): 'project show my-app',
-        ('project', 'add_integration'): 'project add_integration my-app local-files',
-        ('project', 'remove_integration'): 'project remove_integration my-app local-files',
-
-        # Integration examples
-        ('integration', 'create'): 'integration create local-files local --emoji 📁',
-        ('integration', 'list'): 'integration list --sort name',
-        ('integration', 'delete'): 'integration delete local-files --yes',
-        ('integration', 'show'): 'integration show local-files',
-        ('integration', 'modules'): 'integration modules',
-
-        # Project Integration examples
-        ('project_integration', 'add'): 'project_integration add my-app local-files',
-        ('project_integration', 'remove'): 'project_integration remove my-app local-files --yes',
-        ('project_integration', 'list'): 'project_integration list',
-        ('project_integration', 'show'): 'project_integration show my-app-local-files',
-
-        # Database examples
-        ('database', 'list'): 'database list',
-        ('database', 'show'): 'database show sqlite',
-        ('database', 'tests'): 'database tests sqlite',
-        ('database', 'clear'): 'database clear sqlite --yes',
-    }
-
-    return examples.get((group_name, cmd_name))
\ No newline at end of file
@@ -1,91 +1,136 @@
+import copy
+import functools
 import logging
-from typing import Type
+import operator
+from typing import Type, Tuple
 
 import click
 from abc import ABC
 
+try:
+    from tabulate import tabulate
+except ImportError:
+    tabulate = None
+
 from common.enums import EntityType, ApplicationLayer
 from registries.base import Registry
 from services.base import Service
 
 
+def _bind_command(command, subparser):
+    """Copy a command declared on a subparser class with its callback bound to the instance"""
+    bound = copy.copy(command)
+    bound.callback = functools.partial(command.callback, subparser)
+    return bound
+
+
 class SubparserBase(ABC):
     """Minimal CLI base"""
 
     layer = ApplicationLayer.CLI
 
+    # Provided by EntityCapabilities.create_composed_class
+    entity_type: EntityType
+    entity_type_name: str
+
+    logger: logging.Logger
+    # Command templates declared on the class and its bases; bound to an instance per group
+    _commands: Tuple[click.Command, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # One logger per subparser class instead of a getLogger call per instance
+        cls.logger = logging.getLogger(cls.__name__)
+        cls._commands = cls._discover_commands()
+
     def __init__(self, ctx):
         self.ctx = ctx
-        self.registry: Type[Registry] = ctx.obj['registries'][self.entity_type]
+        self.registries = ctx.obj['registries']
+        self.registry: Type[Registry] = self.registries[self.entity_type]
         self.service: Type[Service] = self.registry.service
-        self.logger = logging.getLogger(f"{self.__class__.__name__}")
-        self.logger.debug(f"Initializing {self.entity_type_name} command group")
+        self.logger.debug("Initializing %s command group", self.entity_type_name)
+        self._subparser = None
+        # Name lookups live on NameIndexedRegistryMixin; resolve once instead of per command
+        self._get_by_name = getattr(self.registry, 'get_by_name', None)
 
     def get_subparser(self):
+        """Get the CLI group for this entity, building it on first use"""
+        if self._subparser is None:
+            self._subparser = self._build_subparser()
+        return self._subparser
+
+    def _build_subparser(self):
         """Build CLI group with only relevant commands"""
 
-        @click.group(name=self.entity_type.value)
-        def entity_group(ctx):
+        @click.group(name=self.entity_type_name)
+        def entity_group():
             pass
 
         # Add commands based on mixed-in capabilities
-        for command in self._get_available_commands():
-            entity_group.add_command(command)
+        for command in self._commands:
+            entity_group.add_command(_bind_command(command, self))
 
         return entity_group
 
-    def _get_available_commands(self):
-        """Get commands based on mixed-in CLI capabilities"""
+    @classmethod
+    def _discover_commands(cls):
+        """Collect the click commands declared on a subparser class and its bases"""
         commands = []
-        for attr_name in dir(self):
-            attr = getattr(self, attr_name)
-            if isinstance(attr, click.Command) and callable(attr):
-                commands.append(attr)
-        return commands
+        seen = set()
+        # Walk class dicts in MRO order so subclass attributes shadow base-class commands
+        for klass in cls.__mro__:
+            if klass is object:
+                break
+            for attr_name, attr in vars(klass).items():
+                if attr_name in seen:
+                    continue
+                seen.add(attr_name)
+                if isinstance(attr, click.Command):
+                    commands.append(attr)
+        return tuple(commands)
 
     def _display_entities(self, entities):
         """Display entities in table format"""
-        try:
-            from tabulate import tabulate
-            if not entities:
-                click.echo(f"No {self.entity_type.value}s found")
-                return
-
-            headers = ['name', 'uuid'] + list(entities[0].fields.keys())
-            rows = []
-            for entity in entities:
-                row = [entity.name, str(entity.uuid)] + list(entity.fields.values())
-                rows.append(row)
-
-            click.echo(tabulate(rows, headers=headers))
-        except ImportError:
-            for entity in entities:
-                click.echo(f"  - {entity.name} ({entity.uuid})")
+        if not entities:
+            click.echo(f"No {self.entity_type_name}s found")
+            return
+
+        if tabulate is None:
+            click.echo("\n".join(f"  - {entity.name} ({entity.uuid})" for entity in entities))
+            return
+
+        field_names = tuple(entities[0].fields)
+        headers = ['name', 'uuid', *field_names]
+        get_row = operator.attrgetter('name', 'uuid', 'fields')
+        rows = []
+        for entity in entities:
+            name, uuid, fields = get_row(entity)
+            # Look fields up by header so rows stay aligned even if field order differs
+            rows.append([name, str(uuid), *[fields.get(field, '') for field in field_names]])
+
+        # Field values are user text, so skip tabulate's per-cell number parsing
+        click.echo(tabulate(rows, headers=headers, disable_numparse=True))
 
     def _display_entity_details(self, details):
         """Display single entity details"""
-        for key, value in details.items():
-            click.echo(f"{key}: {value}")
+        click.echo("\n".join(f"{key}: {value}" for key, value in details.items()))
 
     def _validate_entity_name_of_type(self, entity_name, entity_type):
-        entity_registry: Registry = self.registry.manager.get_by_entity_type[entity_type]
+        entity_registry: Registry = self.registries[entity_type]
         entity = entity_registry.get_by_name(entity_name)
         if not entity:
             options = entity_registry.get_all_entities_names()
-            click.echo(f"No {self.entity_type.value} '{entity_name}' found")
-            click.echo(f"Options: {options}")
-            raise ValueError(f"Integration '{entity_name}' not found. Available: {options}")
-            return None
+            click.echo(f"No {entity_type.value} '{entity_name}' found\nOptions: {options}")
+            raise ValueError(f"{entity_type.value.title()} '{entity_name}' not found. Available: {options}")
         return entity
 
     def get_entity_from_name(self, name):
         """Helper to get entity by name given in args with error handling"""
-        if hasattr(self.service, 'get_by_name'):
-            entity = self.service.get_by_name(name)
-            if not entity:
-                click.echo(f"No {self.entity_type.value} '{name}' found")
-                return None
-            return entity
-        else:
-            click.echo(f"Cannot lookup by name for {self.entity_type.value}")
-            return None
\ No newline at end of file
+        if self._get_by_name is None:
+            click.echo(f"Cannot lookup by name for {self.entity_type_name}")
+            return None
+        entity = self._get_by_name(name)
+        if not entity:
+            click.echo(f"No {self.entity_type_name} '{name}' found")
+            return None
+        return entity
\ No newline at end of file
@@ -1,6 +1,9 @@
 import logging
+import os
+
 import click
 from click_shell import shell
+from click_shell.core import Shell
 
 from api.cli._help import _show_main_help
 from entities.database import DatabaseSubparser
@@ -8,8 +11,49 @@ from entities.integration import IntegrationSubparser
 from entities.project import ProjectSubparser
 from entities.project_integration import ProjectIntegrationSubparser
 
+# Resolved once at import; click-shell otherwise shares ~/.click-history with every click-shell app
+HISTORY_FILE = os.path.join(os.path.expanduser('~'), '.luna_history')
+
+SUBPARSER_CLASSES = {
+    subparser_class.entity_type_name: subparser_class
+    for subparser_class in [ProjectSubparser, IntegrationSubparser, DatabaseSubparser, ProjectIntegrationSubparser]
+}
+
+
+class LunaShell(Shell):
+    """Shell group that only builds the entity command group being invoked"""
+
+    def list_commands(self, ctx):
+        return sorted({*super().list_commands(ctx), *SUBPARSER_CLASSES})
+
+    def get_command(self, ctx, cmd_name):
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in SUBPARSER_CLASSES:
+            command = _add_subparser(self, ctx, SUBPARSER_CLASSES[cmd_name])
+        return command
+
+
+def _setup_registries(ctx):
+    """Expose the application registries on the context, once"""
+    if 'registries' not in ctx.obj:
+        app_context = ctx.obj.get('app_context')
+        if not app_context:
+            raise click.ClickException("CLI initialization failed")
+        ctx.obj['registries'] = app_context.registry_manager.registries_by_entity_type
+    return ctx.obj['registries']
+
 
-@shell(prompt='Luna> ', intro='Luna CLI Interactive Session\nType "help" for commands, "exit" to quit\n', invoke_without_command=True)
+def _add_subparser(group, ctx, subparser_class):
+    """Build a subparser's command group and register it on the shell"""
+    _setup_registries(ctx)
+    subparser = subparser_class(ctx)
+    ctx.obj.setdefault('subparsers', {})[subparser.entity_type] = subparser
+    command = subparser.get_subparser()
+    group.add_command(command)
+    return command
+
+
+@shell(cls=LunaShell, hist_file=HISTORY_FILE, prompt='Luna> ', intro='Luna CLI Interactive Session\nType "help" for commands, "exit" to quit\n', invoke_without_command=True)
 @click.pass_context
 def cli(ctx):
     """Luna CLI - Project Management Tool"""
@@ -22,36 +66,31 @@ def cli(ctx):
         app_context = ctx.obj.get('app_context')
         if not app_context:
             logger.error("Application context not available in ctx.obj")
-            logger.debug(f"ctx.obj contents: {ctx.obj}")
+            logger.debug("ctx.obj contents: %s", ctx.obj)
             click.echo("Error: Application context not available", err=True)
             raise click.ClickException("CLI initialization failed")
 
-        logger.debug(f"Got application context: {app_context}")
+        logger.debug("Got application context: %s", app_context)
 
         # Set up registries
-        registries = app_context.registry_manager.registries_by_entity_type
-
-        ctx.obj['registries'] = registries
-        logger.debug(f"Set up registries: {list(registries.keys())}")
-
-        subparsers = {}
+        registries = _setup_registries(ctx)
+        logger.debug("Set up registries: %s", list(registries))
 
-        for subparser_class in [ProjectSubparser, IntegrationSubparser, DatabaseSubparser, ProjectIntegrationSubparser]:
-            subparser = subparser_class(ctx)
-            subparsers[subparser.entity_type] = subparser
-            cli.add_command(subparser.get_subparser())
+        # Single-shot invocations already built the group they need in LunaShell.get_command
+        if ctx.invoked_subcommand is not None:
+            return
 
-        # Store subparsers in context for help generation
-        ctx.obj['subparsers'] = subparsers
+        for name, subparser_class in SUBPARSER_CLASSES.items():
+            if name not in ctx.command.commands:
+                _add_subparser(ctx.command, ctx, subparser_class)
 
         logger.debug("Added all command groups")
 
         # If no subcommand is provided, show help and enter shell mode
-        if ctx.invoked_subcommand is None:
-            logger.debug("No subcommand provided, showing help and entering shell mode")
-            _show_main_help(ctx)
+        logger.debug("No subcommand provided, showing help and entering shell mode")
+        _show_main_help(ctx)
 
     except Exception as e:
         logger.error(f"Error in CLI initialization: {e}", exc_info=True)
         click.echo(f"CLI initialization error: {e}", err=True)
-        raise
\ No newline at end of file
+        raise
@@ -8,6 +8,20 @@ from common.interfaces import ListableInterface, CreatableInterface, DeletableIn
     UserNameableInterface, ImplementationDiscoveryInterface, EditableInterface
 
 
+class NameCheckingSubparserMixin(SubparserBase, ABC):
+    """Shared validation for commands that take a user-provided name"""
+
+    def _check_name(self, name):
+        """Validate a user-provided name once, reporting the reason it was rejected"""
+        # Called on the interface directly: inheriting it here would make Renamable and Nameable
+        # capabilities both claim UserNameableInterface and fail capability validation
+        is_valid, error = UserNameableInterface.is_valid_name(name)
+        if not is_valid:
+            self.logger.error(f"Invalid name '{name}': {error}")
+            click.echo(f"✗ Invalid name '{name}': {error}", err=True)
+        return is_valid
+
+
 class ListableSubparserMixin(SubparserBase, ListableInterface, ABC):
     """CLI implementation of listable capability"""
 
@@ -15,7 +29,7 @@ class ListableSubparserMixin(SubparserBase, ListableInterface, ABC):
     @click.option('--sort', default='name', help='Sort by field')
     @click.option('--filter', 'filter_name', help='Filter by name')
     def list(self, sort, filter_name):
-        entities = self.service.list_entities(sort_by=sort, filter_name=filter_name)
+        entities = self.service.list(sort_by=sort, filter_name=filter_name)
         self._display_entities(entities)
 
     @click.command(CommandType.DETAIL.value)
@@ -24,7 +38,7 @@ class ListableSubparserMixin(SubparserBase, ListableInterface, ABC):
         entity = self.get_entity_from_name(name)
         if not entity:
             return
-        details = self.service.get_entity_details(entity)
+        details = self.service.details(entity)
         self._display_entity_details(details)
 
 class CreatableSubparserMixin(SubparserBase, CreatableInterface, ABC):
@@ -34,21 +48,20 @@ class CreatableSubparserMixin(SubparserBase, CreatableInterface, ABC):
     def create(self):
         self.logger.info(f"Creating {self.entity_type_name}")
         entity = self.service.create()
-        click.echo(f"✓ Created {self.entity_type.value}: {entity.name}")
+        click.echo(f"✓ Created {self.entity_type_name}: {entity.name}")
 
-class UserNameableSubparserMixin(SubparserBase, CreatableInterface, UserNameableInterface, ABC):
+class UserNameableSubparserMixin(NameCheckingSubparserMixin, CreatableInterface, UserNameableInterface, ABC):
     """Create command for user-nameable entities"""
 
     @click.command(CommandType.CREATE.value)
     @click.argument('name')
     def create(self, name):
-        if not self.is_valid_name(name):
-            self.logger.error(f"Invalid name '{name}'")
+        if not self._check_name(name):
             return
         self.logger.info(f"Creating {self.entity_type_name}: {name}")
         kwargs = {'name': name}
         entity = self.service.create(**kwargs)
-        click.echo(f"✓ Created {self.entity_type.value}: {entity.name}")
+        click.echo(f"✓ Created {self.entity_type_name}: {entity.name}")
 
 class DeletableSubparserMixin(SubparserBase, DeletableInterface, ABC):
     """CLI implementation of deletable capability"""
@@ -62,15 +75,15 @@ class DeletableSubparserMixin(SubparserBase, DeletableInterface, ABC):
         if not entity:
             return
 
-        if not yes and not click.confirm(f"Delete {self.entity_type.value} '{name}'?"):
+        if not yes and not click.confirm(f"Delete {self.entity_type_name} '{name}'?"):
             click.echo("Cancelled")
             return
 
         self.service.delete(entity)
-        click.echo(f"✓ Deleted {self.entity_type.value}: {name}")
+        click.echo(f"✓ Deleted {self.entity_type_name}: {name}")
 
 
-class RenamableSubparserMixin(SubparserBase, RenamableInterface, ABC):
+class RenamableSubparserMixin(NameCheckingSubparserMixin, RenamableInterface, ABC):
     """CLI implementation of renamable capability"""
 
     @click.command(CommandType.RENAME.value)
@@ -82,9 +95,11 @@ class RenamableSubparserMixin(SubparserBase, RenamableInterface, ABC):
             click.echo(f"Entity '{old_name}' not found")
             return
 
-        if not self.is_valid_name(new_name):
-            self.logger.error(f"Invalid name '{new_name}'")
-            click.echo(f"<UNK> Invalid name '{new_name}'")
+        if new_name == entity.name:
+            click.echo(f"No changes: {self.entity_type_name} '{old_name}' already has that name")
+            return
+
+        if not self._check_name(new_name):
             return
 
         kwargs = {}
@@ -102,32 +117,29 @@ class DiscoverableImplementationSubparserMixin(SubparserBase, ImplementationDisc
     @click.command(CommandType.LIST_MODULES.value)
     def list_implementations(self):
         modules = self.service.list_implementations()
-        click.echo(f"Available {self.entity_type.value} modules:")
-        for module in modules:
-            click.echo(f"  - {module}")
+        lines = [f"Available {self.entity_type_name} modules:", *(f"  - {module}" for module in modules)]
+        click.echo("\n".join(lines))
 
 
-class CreatableImplementationSubparserMixin(SubparserBase, CreatableInterface, UserNameableInterface, ABC):
+class CreatableImplementationSubparserMixin(NameCheckingSubparserMixin, CreatableInterface, UserNameableInterface, ABC):
     """Create command for module-based entities"""
 
     @click.command(CommandType.CREATE.value)
     @click.argument('name')
     @click.argument('implementation')
     def create(self, name, implementation):
-        if not self.service.is_implementation(implementation):
-            available = self.service.list_implementations()
+        available = self.service.list_implementations()
+        if implementation not in available:
             click.echo(f"Invalid module '{implementation}'. Available: {', '.join(available)}")
             return
 
-        if not self.is_valid_name(name):
-            self.logger.error(f"Invalid name '{name}'")
-            click.echo(f"<UNK> Invalid name '{name}'")
+        if not self._check_name(name):
             return
 
         kwargs = {'name': name, 'implementation': implementation}
 
         entity = self.service.create(**kwargs)
-        click.echo(f"✓ Created {self.entity_type.value}: {entity.name}")
+        click.echo(f"✓ Created {self.entity_type_name}: {entity.name}")
 
 
 class EditableSubparserMixin(SubparserBase, EditableInterface, ABC):
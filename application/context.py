@@ -1,6 +1,6 @@
 import logging
+import os
 import sys
-import traceback
 
 import colorlog
 
@@ -16,9 +16,12 @@ from services.base import Service
 
 class ExceptionFormatter(colorlog.ColoredFormatter):
     def format(self, record):
-        # Auto-include exception info for ERROR and CRITICAL if there's an active exception
-        if record.levelno >= logging.ERROR and not record.exc_info and sys.exc_info()[0] is not None:
-            record.exc_info = sys.exc_info()
+        # Auto-include exception info for ERROR and CRITICAL if there's an active exception.
+        # Full stack traces are opt-in, e.g. LUNA_DEBUG=1 python main.py
+        if record.levelno >= logging.ERROR and not record.exc_info and os.environ.get('LUNA_DEBUG') == '1':
+            exc_info = sys.exc_info()
+            if exc_info[0] is not None:
+                record.exc_info = exc_info
         return super().format(record)
 
 class ApplicationContext:
@@ -48,8 +51,8 @@ class ApplicationContext:
             self.logger.info("Application initialized successfully")
             return True
         except Exception as e:
+            # The formatter attaches the active traceback to ERROR records when LUNA_DEBUG=1
             self.logger.error(f"Error initializing application: {e}")
-            traceback.print_exc()
             return False
 
     def configure_logging(self, level=logging.DEBUG):
@@ -1,5 +1,6 @@
 from abc import ABC
-from typing import List, Type, Dict, Set
+from types import MappingProxyType
+from typing import List, Type, Dict, Set, Tuple, Mapping, Sequence
 from collections import defaultdict
 
 from api.cli.mixins import ListableSubparserMixin, EditableSubparserMixin, DiscoverableImplementationSubparserMixin, \
@@ -19,23 +20,24 @@ from services.mixins import ListableServiceMixin, DiscoverableImplementationServ
 
 class CapabilityDefinition:
     """Base class for capability definitions"""
-    capability_dependencies: List = []  # capabilities which must be implemented alongside this capability
-    interface_dependencies: List = [] # interfaces which must be implemented by some other capability alongside this capability
-    mixin_dependencies: List = []  # mixins which must be implemented by some other capability alongside this capability
+    # Defaults are immutable since they are shared by every capability that doesn't override them
+    capability_dependencies: Sequence = ()  # capabilities which must be implemented alongside this capability
+    interface_dependencies: Sequence = () # interfaces which must be implemented by some other capability alongside this capability
+    mixin_dependencies: Sequence = ()  # mixins which must be implemented by some other capability alongside this capability
     # Concrete implementations for each layer
-    mixins: Dict[ApplicationLayer, List] = {
-        ApplicationLayer.ENTITY: [],
-        ApplicationLayer.REGISTRY: [],
-        ApplicationLayer.SERVICE: [],
-        ApplicationLayer.CLI: [],
-    }
+    mixins: Mapping[ApplicationLayer, Sequence] = MappingProxyType({
+        ApplicationLayer.ENTITY: (),
+        ApplicationLayer.REGISTRY: (),
+        ApplicationLayer.SERVICE: (),
+        ApplicationLayer.CLI: (),
+    })
 
 
 class EntityCapabilities(ABC):
     """Base class for entity capability declarations with composition functionality"""
 
     # Subclasses override this to declare their capabilities
-    capabilities: List[Type[CapabilityDefinition]] = []
+    capabilities: Sequence[Type[CapabilityDefinition]] = ()
 
     # Set by EntityInitializer during __init__
     entity_type: EntityType
@@ -52,28 +54,19 @@ class EntityCapabilities(ABC):
         return result
 
     @classmethod
-    def get_mixins_for_layer(cls, layer: ApplicationLayer) -> List[Type]:
-        """Get all mixins needed for a specific layer"""
-        mixins = []
-        for capability in cls.capabilities:
-            layer_mixins = capability.mixins.get(layer, [])
-            mixins.extend(layer_mixins)
-
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_mixins = []
-        for mixin in mixins:
-            if mixin not in seen:
-                seen.add(mixin)
-                unique_mixins.append(mixin)
-
-        return unique_mixins
+    def get_mixins_for_layer(cls, layer: ApplicationLayer) -> Tuple[Type, ...]:
+        """Get all mixins needed for a specific layer, removing duplicates while preserving order"""
+        return tuple(dict.fromkeys(
+            mixin
+            for capability in cls.capabilities
+            for mixin in capability.mixins.get(layer, ())
+        ))
 
     @classmethod
     def create_composed_class(cls, name: str, base_class) -> Type:
         """Dynamically create a class with required mixins for this entity's capabilities"""
         mixins = cls.get_mixins_for_layer(base_class.layer)
-        bases = (base_class,) + tuple(mixins)
+        bases = (base_class,) + mixins
         c = type(name, bases, {})
         c.entity_type = cls.entity_type
         c.entity_type_name = cls.entity_type.value
@@ -118,7 +111,7 @@ class EntityCapabilities(ABC):
         # Map each interface to all capabilities that implement it (across all layers)
         for capability in cls.capabilities:
             for layer in ApplicationLayer:
-                layer_mixins = capability.mixins.get(layer, [])
+                layer_mixins = capability.mixins.get(layer, ())
                 for mixin in layer_mixins:
                     interfaces = cls._get_mixin_interfaces(mixin)
                     for interface in interfaces:
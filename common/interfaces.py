@@ -1,5 +1,10 @@
+import re
 from abc import ABC, abstractmethod
-from typing import List, Any, Dict, Type, re
+from typing import List, Any, Dict, Type
+
+# Compiled once for UserNameableInterface.is_valid_name
+_CONTROL_CHARS = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]')
+_RESERVED_CHARS = frozenset('<>"|\0/\\:*?')
 
 
 class Interface(ABC):
@@ -71,13 +76,12 @@ class UserNameableInterface(Interface, ABC):
             return False, f"Name too long (max {max_length} characters)"
 
         # Check for control characters (except normal whitespace)
-        if re.search(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', trimmed):
+        if _CONTROL_CHARS.search(trimmed):
             return False, "Name contains invalid control characters"
 
         # Optional: Check for potentially problematic characters
         # This is very permissive - only blocks the most problematic ones
-        dangerous_chars = ['<', '>', '"', '|', '\0', '/', '\\', ':', '*', '?']
-        if any(char in trimmed for char in dangerous_chars):
+        if not _RESERVED_CHARS.isdisjoint(trimmed):
             return False, "Name contains reserved characters"
 
         return True, ""
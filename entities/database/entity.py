@@ -138,7 +138,7 @@ class DatabaseBase(Entity):
             # Define all tables with fresh Field objects and proper migration
             for table_name, field_specs in table_definitions.items():
                 if not hasattr(self.dal, table_name):
-                    self.logger.debug(f"Defining '{table_name}' table")
+                    self.logger.debug("Defining '%s' table", table_name)
                     field_defs = self._create_field_objects(field_specs)
                     self.dal.define_table(table_name, *field_defs, migrate=True)
             return True        
@@ -232,7 +232,7 @@ class DatabaseBase(Entity):
             os.makedirs(db_dir, exist_ok=True)
             
             # Create the DAL connection
-            self.logger.debug(f"Initializing database connection: {self._connection_string}")
+            self.logger.debug("Initializing database connection: %s", self._connection_string)
             self.dal = DAL(
                 self._connection_string, 
                 folder=self._db_dir, 
@@ -292,7 +292,7 @@ class DatabaseBase(Entity):
                 **entity.fields
             }
 
-            self.logger.debug(f"Upserting {record}")
+            self.logger.debug("Upserting %s", record)
 
             # Check if entity exists
             with self.transaction():
@@ -307,7 +307,7 @@ class DatabaseBase(Entity):
             # Insert new document and return the ID
             with self.transaction():
                 new_id = table.insert(**record)
-            self.logger.debug(f"Upserted record {record} to table {table_name}")
+            self.logger.debug("Upserted record %s to table %s", record, table_name)
             return new_id
         except Exception as e:
             self.logger.error(f"Error in upsert: {e}")
@@ -50,7 +50,7 @@ class DatabaseRegistryBase(Registry):
         if db:
             self._active_db_ref = val
             self.manager.update_db(val)
-            self.logger.debug(f"Set active database to: {db.name}")
+            self.logger.debug("Set active database to: %s", db.name)
         else:
             self.logger.error(f"Database not found for ref: {val}")
 
@@ -82,7 +82,7 @@ class DatabaseRegistryBase(Registry):
         for db in self.get_all_entities():
             try:
                 db.close()
-                self.logger.debug(f"Closed database: {db.name}")
+                self.logger.debug("Closed database: %s", db.name)
             except Exception as e:
                 self.logger.error(f"Error closing database {db.name}: {e}")
                 import traceback
@@ -24,7 +24,7 @@ class ProjectSubparserBase(SubparserBase, ProjectInterface):
             project = self._validate_entity_name_of_type(project_name, EntityType.PROJECT)
             integration = self._validate_entity_name_of_type(integration_name, EntityType.INTEGRATION)
 
-            self.logger.debug(f"Adding integration {integration.name} to project {project.name}")
+            self.logger.debug("Adding integration %s to project %s", integration.name, project.name)
             self.service.add_integration(project, integration)
 
             click.echo(f"✓ Added integration '{integration.name}' to project '{project.name}'")
@@ -50,7 +50,7 @@ class ProjectSubparserBase(SubparserBase, ProjectInterface):
             project = self._validate_entity_name_of_type(project_name, EntityType.PROJECT)
             integration = self._validate_entity_name_of_type(integration_name, EntityType.INTEGRATION)
 
-            self.logger.debug(f"Removing integration {integration.name} from project {project.name}")
+            self.logger.debug("Removing integration %s from project %s", integration.name, project.name)
             self.service.remove_integration(project, integration)
 
             click.echo(f"✓ Removed integration '{integration.name}' from project {project.name}")
@@ -1,5 +1,4 @@
 import logging
-import traceback
 
 from api.cli.main import cli
 from application.context import ApplicationContext
@@ -20,8 +19,8 @@ def main():
                 return
 
     except Exception as e:
+        # Logged as one line; ExceptionFormatter adds the stack trace when LUNA_DEBUG=1
         logging.error(f"Error in main: {e}")
-        traceback.print_exc()
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
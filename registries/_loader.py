@@ -85,7 +85,7 @@ class RegistryImplementationLoader(RegistryLoader):
                 entity = self._create_entity(entity_class, **entity_kwargs)
                 if entity:
                     entities.append(entity)
-                    self.logger.debug(f"Loaded {self.entity_type_name}: {entity.name} from {implementation_info.module_name}")
+                    self.logger.debug("Loaded %s: %s from %s", self.entity_type_name, entity.name, implementation_info.module_name)
                 else:
                     error_msg = f"Failed to create {entity_class.__name__} from {implementation_info.module_name}"
                     errors.append(error_msg)
@@ -246,7 +246,7 @@ class RegistryDatabaseLoader(RegistryLoader):
             entity = self._create_entity(self.entity_class, **entity_kwargs)
             if entity:
                 entities.append(entity)
-                self.logger.debug(f"Loaded {self.entity_type_name}: {entity} from table {self.entity_type_name}")
+                self.logger.debug("Loaded %s: %s from table %s", self.entity_type_name, entity, self.entity_type_name)
             else:
                 error_msg = f"Failed to create {self.entity_type_name} from table {self.entity_type_name} with data: {data}"
                 errors.append(error_msg)
@@ -269,7 +269,7 @@ class RegistryDatabaseLoader(RegistryLoader):
                 except Exception as e:
                     self.logger.error(f"Error converting row to dict from {self.entity_type_name}: {e}")
 
-            self.logger.debug(f"Fetched data for {len(entity_data)} records from {self.entity_type_name}")
+            self.logger.debug("Fetched data for %s records from %s", len(entity_data), self.entity_type_name)
             return entity_data
 
         except Exception as e:
@@ -59,12 +59,12 @@ class Registry(ABC):
 
     def register_entity(self, entity: 'Entity') -> None:
         """Register an entity with this registry."""
-        self.logger.debug(f'Registering {entity}')
+        self.logger.debug('Registering %s', entity)
         self._entities[entity.uuid] = entity
 
     def unregister_entity(self, entity: 'Entity') -> None:
         """Remove an entity from this registry."""
-        self.logger.debug(f"Unregistering entity: {entity}")
+        self.logger.debug("Unregistering entity: %s", entity)
         del self._entities[entity.uuid]
 
     def get_by_id(self, entity_id: UUID) -> Optional['Entity']:
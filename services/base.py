@@ -19,4 +19,4 @@ class Service(ABC):
     def __init__(self, registry):
         self.registry = registry
         self.logger = logging.getLogger(f"{self.__class__.__name__}")
-        self.logger.debug(f"Initialized {self.__class__.__name__}")
\ No newline at end of file
+        self.logger.debug("Initialized %s", self.__class__.__name__)
\ No newline at end of file
@@ -1,7 +1,7 @@
 from typing import Any, Type, List, Union, Dict
 
 from common.interfaces import ListableInterface, CreatableInterface, DeletableInterface, RenamableInterface, \
-    EditableInterface, ImplementationDiscoveryInterface
+    EditableInterface, ImplementationDiscoveryInterface, UserNameableInterface
 from entities.base import Entity
 from entities.mixins import DatabasePropertyMixin, UserNameablePropertyMixin, ReadOnlyNamePropertyMixin
 from services.base import Service
@@ -13,17 +13,21 @@ class ListableServiceMixin(ListableInterface, Service, ABC):
 
     def list(self, sort_by: str = "name", filter_name: str = None) -> List[Any]:
         """List entities with enhanced error logging"""
-        self.logger.debug(f"Listing entities with sort_by='{sort_by}', filter_name='{filter_name}'")
+        self.logger.debug("Listing entities with sort_by='%s', filter_name='%s'", sort_by, filter_name)
 
         try:
             entities = self.registry.get_all_entities()
-            self.logger.debug(f"Retrieved {len(entities)} entities from registry")
+            self.logger.debug("Retrieved %s entities from registry", len(entities))
 
             # Apply filter
             if filter_name:
                 original_count = len(entities)
-                entities = [e for e in entities if filter_name.lower() in e.name.lower()]
-                self.logger.debug(f"Filter '{filter_name}' reduced entities from {original_count} to {len(entities)}")
+                filter_lower = filter_name.lower()
+                entities = [e for e in entities if filter_lower in e.name.lower()]
+                self.logger.debug("Filter '%s' reduced entities from %s to %s", filter_name, original_count, len(entities))
+
+            if not entities:
+                return entities
 
             fields = entities[0].fields
             if sort_by in fields:
@@ -33,7 +37,7 @@ class ListableServiceMixin(ListableInterface, Service, ABC):
             else:
                 self.logger.warning(f"Unknown sort_by value: '{sort_by}', using default order")
 
-            self.logger.debug(f"Returning {len(entities)} sorted entities")
+            self.logger.debug("Returning %s sorted entities", len(entities))
             return entities
 
         except Exception as e:
@@ -72,16 +76,16 @@ class CreatableServiceMixin(CreatableInterface, Service, ABC):
         entity = None
         try:
             # Create entity
-            self.logger.debug(f"Instantiating {self.entity_class.__name__}")
+            self.logger.debug("Instantiating %s", self.entity_class.__name__)
             entity: Type[Entity, DatabasePropertyMixin] = self.entity_class(registry=self.registry, **kwargs)
-            self.logger.debug(f"Created {self.entity_type.value}: {entity}")
+            self.logger.debug("Created %s: %s", self.entity_type.value, entity)
 
             # Entity-specific create logic
-            self.logger.debug(f"Doing {self.entity_type.value} create cleanup")
+            self.logger.debug("Doing %s create cleanup", self.entity_type.value)
             self._create_cleanup(entity)
 
             # Save to database
-            self.logger.debug(f"Saving {self.entity_type.value} to database")
+            self.logger.debug("Saving %s to database", self.entity_type.value)
             success = entity.db_upsert()
             if not success:
                 self.logger.error(f"Database upsert failed for {self.entity_type.value} {entity.name}")
@@ -109,18 +113,18 @@ class DeletableServiceMixin(DeletableInterface, Service, ABC):
         self.logger.info(f"Attempting to delete {self.entity_type.value}: {entity.name} (ID: {entity.uuid})")
 
         try:
-            self.logger.debug(f"Doing {self.entity_type.value} delete cleanup")
+            self.logger.debug("Doing %s delete cleanup", self.entity_type.value)
             self._delete_cleanup(entity)
 
             # Remove from database
-            self.logger.debug(f"Removing {self.entity_type.value} from database (db_id: {entity.db_id})")
+            self.logger.debug("Removing %s from database (db_id: %s)", self.entity_type.value, entity.db_id)
             with entity.db.transaction():
                 table = getattr(entity.db.dal, self.entity_type_name)
                 deleted_count = entity.db.dal(table.id == entity.db_id).delete()
-                self.logger.debug(f"Database delete affected {deleted_count} rows")
+                self.logger.debug("Database delete affected %s rows", deleted_count)
 
             # Remove from registry
-            self.logger.debug(f"Unregistering {self.entity_type.value}: {entity.name}")
+            self.logger.debug("Unregistering %s: %s", self.entity_type.value, entity.name)
             self.registry.unregister_entity(entity)
 
             self.logger.info(f"Successfully deleted {self.entity_class.__name__}: {entity.name}")
@@ -140,22 +144,33 @@ class RenamableServiceMixin(RenamableInterface, Service, ABC):
         """Rename an entity"""
         self.logger.info(f"Attempting to rename {self.entity_type.value}: {entity.name} (ID: {entity.uuid})")
 
-        if hasattr(self, 'is_valid_name') and not self.is_valid_name(new_name):
-            raise ValueError(f"Invalid name: {new_name}")
+        # Renamable entities are always user-nameable, so validate with the shared rules
+        is_valid, error = UserNameableInterface.is_valid_name(new_name)
+        if not is_valid:
+            raise ValueError(f"Invalid name '{new_name}': {error}")
 
         old_name = entity.name
+
+        # Nothing to rename, skip the cleanup hooks and database write
+        if new_name == old_name:
+            self.logger.debug("%s %s already has that name, skipping rename", self.entity_type.value, old_name)
+            return {
+                "old_name": old_name,
+                "new_name": new_name,
+            }
+
         entity.name = new_name
 
         # Entity-specific rename logic
-        self.logger.debug(f"Doing {self.entity_type.value} rename cleanup")
+        self.logger.debug("Doing %s rename cleanup", self.entity_type.value)
         self._rename_cleanup(entity, old_name, **kwargs)
 
         # Save changes
-        self.logger.debug(f"Updating record in DB")
+        self.logger.debug("Updating record in DB")
         entity.db_upsert()
 
         # Update registry index
-        self.logger.debug(f"Unregistering {self.entity_type.value}: {entity.name}")
+        self.logger.debug("Unregistering %s: %s", self.entity_type.value, entity.name)
         self.registry.update_name_index(entity, old_name)
 
         return {
@@ -170,10 +185,10 @@ class EditableServiceMixin(EditableInterface, Service, ABC):
         """Edit an entity"""
         self.logger.info(f"Attempting to edit {self.entity_type.value}: {entity.name}")
 
-        self.logger.debug(f"Updating {self.entity_type.value} {entity.name} config: {config_updates}")
+        self.logger.debug("Updating %s %s config: %s", self.entity_type.value, entity.name, config_updates)
         entity.config.update(config_updates)
 
-        self.logger.debug(f"Updating record in DB")
+        self.logger.debug("Updating record in DB")
         entity.db_upsert()
 
         return entity
@@ -185,7 +200,7 @@ class DiscoverableImplementationServiceMixin(ImplementationDiscoveryInterface, S
         return self.registry.implementation_loader.get_implementation_filenames()
 
     def is_implementation(self, module_name):
-        return module_name in self.registry.list_implementations()
+        return module_name in self.list_implementations()
 
 class LoadableImplementationServiceMixin(CreatableInterface, Service, ABC):
 
@@ -207,12 +222,12 @@ class CreatableImplementationServiceMixin(CreatableInterface, Service, ABC):
 
         try:
             # Create entity
-            self.logger.debug(f"Instantiating {self.entity_class.__name__}")
+            self.logger.debug("Instantiating %s", self.entity_class.__name__)
             entity: Type[Entity, DatabasePropertyMixin] = self.registry.module_loader.load(**kwargs)
-            self.logger.debug(f"Created {self.entity_type.value}: {entity}")
+            self.logger.debug("Created %s: %s", self.entity_type.value, entity)
 
             # Save to database
-            self.logger.debug(f"Saving {self.entity_type.value} to database")
+            self.logger.debug("Saving %s to database", self.entity_type.value)
             success = entity.db_upsert()
             if not success:
                 self.logger.error(f"Database upsert failed for {self.entity_type.value} {entity.name}")
@@ -78,4 +78,102 @@ class TestValidation:
             project_service.create(name="")  # Empty name
 
         with pytest.raises(ValueError):
-            project_service.create(name="   ")  # Whitespace only
\ No newline at end of file
+            project_service.create(name="   ")  # Whitespace only
+
+    def test_is_valid_name_rejects_reserved_and_control_characters(self):
+        """Test the shared name validator used by user-nameable entities"""
+        from common.interfaces import UserNameableInterface
+
+        assert UserNameableInterface.is_valid_name("my-project") == (True, "")
+        assert UserNameableInterface.is_valid_name("a/b")[0] is False
+        assert UserNameableInterface.is_valid_name("tab\x01name")[0] is False
+        assert UserNameableInterface.is_valid_name("   ")[0] is False
+
+
+@pytest.fixture
+def cli_invoke(temp_app, tmp_path):
+    """Run one-shot CLI commands against the temp app through a fresh shell, leaving the global cli untouched"""
+    from click.testing import CliRunner
+    from click_shell import shell
+    from api.cli.main import LunaShell, cli
+
+    test_cli = shell(name=cli.name, cls=LunaShell, hist_file=str(tmp_path / 'history'),
+                     invoke_without_command=True)(cli.callback)
+    runner = CliRunner()
+    return lambda *args: runner.invoke(test_cli, list(args), obj={'app_context': temp_app})
+
+
+class TestCli:
+    """Test one-shot CLI dispatch"""
+
+    def test_entity_group_dispatches_single_command(self, cli_invoke):
+        """Test that a group is built on demand and its commands receive the subparser"""
+        result = cli_invoke('project', 'list')
+        assert result.exit_code == 0, result.output
+        assert "No projects found" in result.output
+
+    def test_help_lists_every_entity_group(self, cli_invoke):
+        """Test that --help builds and lists all entity groups"""
+        result = cli_invoke('--help')
+        assert result.exit_code == 0, result.output
+        for group_name in ('database', 'integration', 'project', 'project_integration'):
+            assert group_name in result.output
+
+    def test_global_cli_left_untouched(self, cli_invoke):
+        """Test that building groups for a test app does not register them on the module-level shell"""
+        from api.cli.main import cli
+
+        assert cli_invoke('project', 'list').exit_code == 0
+        assert 'project' not in cli.commands
+        assert not hasattr(cli.shell, 'do_project')
+
+    def test_unknown_group_rejected(self, cli_invoke):
+        """Test that an unknown group name is reported by click"""
+        result = cli_invoke('nope', 'list')
+        assert result.exit_code == 2
+        assert "No such command 'nope'" in result.output
+
+    def test_bound_command_receives_arguments(self, cli_invoke, temp_app):
+        """Test that a bound command resolves its argument against the subparser's registry"""
+        project_service = temp_app.get_service(EntityType.PROJECT)
+        project = project_service.entity_class(registry=project_service.registry, name="demo")
+
+        result = cli_invoke('project', 'detail', 'demo')
+        assert result.exit_code == 0, result.output
+        assert "name: demo" in result.output
+        assert f"uuid: {project.uuid}" in result.output
+
+    def test_rename_to_same_name_reports_no_changes(self, cli_invoke, temp_app):
+        """Test that renaming to the current name is reported as a no-op"""
+        project_service = temp_app.get_service(EntityType.PROJECT)
+        project_service.entity_class(registry=project_service.registry, name="demo")
+
+        result = cli_invoke('project', 'rename', 'demo', 'demo')
+        assert result.exit_code == 0, result.output
+        assert "No changes" in result.output
+        assert "Renamed" not in result.output
+
+
+class TestErrorReporting:
+    """Test how startup errors are reported"""
+
+    @pytest.mark.parametrize("debug, tracebacks", [(None, 0), ("1", 1)])
+    def test_main_traceback_is_opt_in(self, monkeypatch, capsys, debug, tracebacks):
+        """Test that main() logs one line by default and a single traceback with LUNA_DEBUG=1"""
+        import main
+
+        def fail(self):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(main.ApplicationContext, 'initialize', fail)
+        if debug:
+            monkeypatch.setenv('LUNA_DEBUG', debug)
+        else:
+            monkeypatch.delenv('LUNA_DEBUG', raising=False)
+
+        main.main()
+
+        captured = capsys.readouterr()
+        output = captured.out + captured.err
+        assert "Error in main: boom" in output
+        assert output.count("Traceback (most recent call last)") == tracebacks
@@ -1,10 +1,10 @@
 from pathlib import Path
 from typing import Literal
 
-import trimesh
 import yaml
-from moviepy import VideoFileClip
-from PIL import Image
+
+# trimesh, moviepy and Pillow are imported inside the converters that need them;
+# they are heavy and most callers only use the template/config helpers
 
 
 def load_template(self, template_name: str) -> str:
@@ -34,6 +34,8 @@ def deep_merge(base, update):
     return base
 
 def convert_model_file(self, model_file, output_format: Literal['glb']='glb'):
+    import trimesh
+
     try:
         # Load the STL file
         mesh = trimesh.load(model_file)
@@ -76,6 +78,8 @@ def convert_model_file(self, model_file, output_format: Literal['glb']='glb'):
         raise self.logger.error(f"Failed to convert model: {str(e)}")
 
 def convert_video_file(self, video_file, output_format: Literal['mp4', 'webm'] = 'mp4'):
+    from moviepy import VideoFileClip
+
     try:
         video = VideoFileClip(video_file)
         # Create temp file with new extension
@@ -113,7 +117,8 @@ def get_image_dimensions(self, image_path):
         return img.size
 
 def resize_image_file(self, image_file, max_width: int=-1, max_height: int=-1):
-        
+    from PIL import Image
+
     with Image.open(image_file) as img:
         # Get original dimensions
         width, height = img.size